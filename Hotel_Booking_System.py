@@ -1,24 +1,162 @@
+import os
+import queue
 import sqlite3
 import hashlib
+import hmac
+import threading
+import time
+import traceback
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime, date, timedelta
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-from tkcalendar import DateEntry
 
 DB = "hotel.db"
 
 # ---------------------------
 # Database utilities
 # ---------------------------
-def get_db():
-    conn = sqlite3.connect(DB)
+# Columns declared DATE are stored as YYYY-MM-DD; hand them back as date objects
+sqlite3.register_converter("DATE", lambda b: date(int(b[:4]), int(b[5:7]), int(b[8:10])))
+
+def _connect(path=DB):
+    """Open a connection with the pragmas the app relies on."""
+    conn = sqlite3.connect(path, check_same_thread=False, cached_statements=256,
+                           detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute("PRAGMA mmap_size=268435456")  # read pages via a 256 MiB memory map
+    conn.execute("PRAGMA foreign_keys=ON")
     return conn
 
-def create_tables():
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("""
+class ConnectionPool:
+    """A small pool of persistent connections that can be borrowed from any thread.
+
+    Connections are opened up front (minsize) and on demand up to maxsize;
+    they are never closed until shutdown(), so each keeps its page cache and
+    prepared statements warm.
+    """
+
+    def __init__(self, path, minsize=2, maxsize=5):
+        self.path = path
+        self.maxsize = maxsize
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._opened = minsize
+        self._acquisitions = 0
+        self._wait_total = 0.0
+        for _ in range(minsize):
+            self._idle.put(_connect(path))
+
+    @contextmanager
+    def get_connection(self):
+        """Borrow a connection; it goes back to the pool when the block exits."""
+        started = time.perf_counter()
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                grow = self._opened < self.maxsize
+                if grow:
+                    self._opened += 1
+            if grow:
+                try:
+                    conn = _connect(self.path)
+                except Exception:
+                    # Give the slot back, or every failure shrinks the pool for good
+                    with self._lock:
+                        self._opened -= 1
+                    raise
+            else:
+                conn = self._idle.get()
+        with self._lock:
+            self._acquisitions += 1
+            self._wait_total += time.perf_counter() - started
+        try:
+            yield conn
+        finally:
+            # Never hand the next borrower someone else's open transaction
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+    def health(self):
+        """Return usage counters, handy when debugging from a shell."""
+        with self._lock:
+            n = self._acquisitions
+            return {
+                "open_connections": self._opened,
+                "idle_connections": self._idle.qsize(),
+                "total_acquisitions": n,
+                "average_wait_time_ms": self._wait_total / n * 1000 if n else 0.0,
+            }
+
+    def shutdown(self):
+        """Close every idle connection.
+
+        Each runs PRAGMA optimize first; by now it has a query history for
+        SQLite to judge which tables' statistics are worth refreshing.
+        """
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass  # stale statistics are not worth failing shutdown over
+            conn.close()
+
+_POOL = ConnectionPool(DB)
+
+def get_db():
+    """Borrow a pooled connection: ``with get_db() as conn: ...``"""
+    return _POOL.get_connection()
+
+def q(sql, params=()):
+    """Run a query on a pooled connection and return all rows."""
+    with _POOL.get_connection() as conn:
+        return conn.execute(sql, params).fetchall()
+
+def q_map(fn, sql, params=(), arraysize=200):
+    """Run a query and return [fn(row) ...], pulling rows arraysize at a time.
+
+    Rows are converted as they arrive, so the sqlite3.Row objects never
+    pile up in a list alongside their converted copies.
+    """
+    with _POOL.get_connection() as conn:
+        cur = conn.execute(sql, params)
+        cur.arraysize = arraysize
+        out = []
+        while batch := cur.fetchmany():
+            out.extend(map(fn, batch))
+        return out
+
+def q_one(sql, params=()):
+    """Run a query on a pooled connection and return the first row (or None)."""
+    with _POOL.get_connection() as conn:
+        return conn.execute(sql, params).fetchone()
+
+def q_exec(sql, params=()):
+    """Run one write in its own transaction; return the cursor for rowcount/lastrowid."""
+    with _POOL.get_connection() as conn, conn:
+        return conn.execute(sql, params)
+
+def q_exec_many(sql, seq_of_params):
+    """Run a write for each parameter tuple in a single transaction."""
+    with _POOL.get_connection() as conn, conn:
+        return conn.executemany(sql, seq_of_params)
+
+# Schema, applied in order by create_tables()
+_SQL_SCHEMA = (
+    """
     CREATE TABLE IF NOT EXISTS Rooms (
         room_id INTEGER PRIMARY KEY AUTOINCREMENT,
         room_number TEXT UNIQUE,
@@ -26,16 +164,17 @@ def create_tables():
         price_per_night REAL,
         status TEXT DEFAULT 'Available', 
         description TEXT
-    )""")
-    c.execute("""
+    )""",
+    """
     CREATE TABLE IF NOT EXISTS Customers (
         customer_id INTEGER PRIMARY KEY AUTOINCREMENT,
         name TEXT,
         email TEXT UNIQUE,
         phone TEXT,
-        password_hash TEXT
-    )""")
-    c.execute("""
+        password_hash TEXT,
+        salt BLOB
+    )""",
+    """
     CREATE TABLE IF NOT EXISTS Bookings (
         booking_id INTEGER PRIMARY KEY AUTOINCREMENT,
         customer_id INTEGER,
@@ -46,63 +185,147 @@ def create_tables():
         created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
         FOREIGN KEY(customer_id) REFERENCES Customers(customer_id),
         FOREIGN KEY(room_id) REFERENCES Rooms(room_id)
-    )""")
-    c.execute("""
+    )""",
+    """
     CREATE TABLE IF NOT EXISTS Payments (
         payment_id INTEGER PRIMARY KEY AUTOINCREMENT,
         booking_id INTEGER,
+        customer_id INTEGER,
         amount REAL,
         payment_date DATETIME DEFAULT CURRENT_TIMESTAMP,
         payment_mode TEXT,
-        FOREIGN KEY(booking_id) REFERENCES Bookings(booking_id)
-    )""")
-    c.execute("""
+        FOREIGN KEY(booking_id) REFERENCES Bookings(booking_id),
+        FOREIGN KEY(customer_id) REFERENCES Customers(customer_id)
+    )""",
+    """
     CREATE TABLE IF NOT EXISTS Staff (
         staff_id INTEGER PRIMARY KEY AUTOINCREMENT,
         name TEXT,
         role TEXT,
         email TEXT UNIQUE,
         phone TEXT,
-        password_hash TEXT
-    )""")
+        password_hash TEXT,
+        salt BLOB
+    )""",
+)
+
+# Created after the column migrations. Customers/Staff email lookups are
+# already covered by their UNIQUE indexes.
+_SQL_INDEXES = (
+    """
+    CREATE INDEX IF NOT EXISTS idx_bookings_room_status
+        ON Bookings(room_id, status, check_in, check_out)""",
+    "CREATE INDEX IF NOT EXISTS idx_bookings_status ON Bookings(status)",
+    # Paged list screens: newest-first ordering and the Payments lookups
+    """
+    CREATE INDEX IF NOT EXISTS idx_bookings_customer_created
+        ON Bookings(customer_id, created_at DESC)""",
+    "CREATE INDEX IF NOT EXISTS idx_bookings_created ON Bookings(created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_payments_date ON Payments(payment_date DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_payments_booking ON Payments(booking_id)",
+    # Revenue totals (payment report and dashboard) read only this narrow index
+    "CREATE INDEX IF NOT EXISTS idx_payments_amount ON Payments(amount)",
+)
+
+def create_tables(conn):
+    c = conn.cursor()
+    for sql in _SQL_SCHEMA:
+        c.execute(sql)
+    # Databases created before password salting need the column added
+    for table in ("Customers", "Staff"):
+        cols = [r["name"] for r in c.execute(f"PRAGMA table_info({table})")]
+        if "salt" not in cols:
+            c.execute(f"ALTER TABLE {table} ADD COLUMN salt BLOB")
+    # Payments carry the paying customer so the history needn't join through Bookings
+    cols = [r["name"] for r in c.execute("PRAGMA table_info(Payments)")]
+    if "customer_id" not in cols:
+        c.execute("ALTER TABLE Payments ADD COLUMN customer_id INTEGER REFERENCES Customers(customer_id)")
+        c.execute("""
+        UPDATE Payments SET customer_id = (
+            SELECT b.customer_id FROM Bookings b WHERE b.booking_id = Payments.booking_id
+        )""")
+    for sql in _SQL_INDEXES:
+        c.execute(sql)
     conn.commit()
-    conn.close()
 
-def seed_data():
-    conn = get_db()
+# Sample rooms inserted into an empty Rooms table
+_SEED_ROOMS = (
+    ("101", "Single", 1500.0, "Available", "Cozy single bed with AC and WiFi"),
+    ("102", "Double", 2500.0, "Available", "Double bed with sea view and balcony"),
+    ("103", "Single", 1600.0, "Available", "Single bed with garden view"),
+    ("201", "Suite", 5000.0, "Available", "Luxury suite with living area and kitchen"),
+    ("202", "Double", 2600.0, "Available", "Double bed with city view and balcony"),
+    ("203", "Suite", 4800.0, "Available", "Executive suite with workspace"),
+    ("301", "Double", 2400.0, "Available", "Double bed with pool view"),
+    ("302", "Single", 1550.0, "Available", "Compact single room with all amenities"),
+)
+
+_SQL_FIND_STAFF = "SELECT 1 FROM Staff WHERE email = ? LIMIT 1"
+_SQL_INSERT_STAFF = "INSERT INTO Staff (name,role,email,phone,password_hash,salt) VALUES (?,?,?,?,?,?)"
+_SQL_ANY_ROOM = "SELECT 1 FROM Rooms LIMIT 1"
+_SQL_INSERT_ROOM = "INSERT INTO Rooms (room_number,room_type,price_per_night,status,description) VALUES (?,?,?,?,?)"
+
+def seed_data(conn):
     c = conn.cursor()
-    # Create sample admin staff if not exists
-    c.execute("SELECT * FROM Staff WHERE email = ?", ("admin@hotel",))
-    if not c.fetchone():
-        pw = hash_password("admin123")
-        c.execute("INSERT INTO Staff (name,role,email,phone,password_hash) VALUES (?,?,?,?,?)",
-                  ("Admin", "Manager", "admin@hotel", "0000000000", pw))
-    # Create sample rooms if table empty
-    c.execute("SELECT COUNT(*) as cnt FROM Rooms")
-    if c.fetchone()["cnt"] == 0:
-        rooms = [
-            ("101", "Single", 1500.0, "Available", "Cozy single bed with AC and WiFi"),
-            ("102", "Double", 2500.0, "Available", "Double bed with sea view and balcony"),
-            ("103", "Single", 1600.0, "Available", "Single bed with garden view"),
-            ("201", "Suite", 5000.0, "Available", "Luxury suite with living area and kitchen"),
-            ("202", "Double", 2600.0, "Available", "Double bed with city view and balcony"),
-            ("203", "Suite", 4800.0, "Available", "Executive suite with workspace"),
-            ("301", "Double", 2400.0, "Available", "Double bed with pool view"),
-            ("302", "Single", 1550.0, "Available", "Compact single room with all amenities"),
-        ]
-        for r in rooms:
-            c.execute("INSERT INTO Rooms (room_number,room_type,price_per_night,status,description) VALUES (?,?,?,?,?)", r)
-    conn.commit()
-    conn.close()
+    seeded = False
+    # Seed everything in one write transaction (rolled back on error)
+    with conn:
+        c.execute("BEGIN IMMEDIATE")
+        # Create sample admin staff if not exists
+        c.execute(_SQL_FIND_STAFF, ("admin@hotel",))
+        if c.fetchone() is None:
+            salt = new_salt()
+            pw = hash_password("admin123", salt)
+            c.execute(_SQL_INSERT_STAFF, ("Admin", "Manager", "admin@hotel", "0000000000", pw, salt))
+            seeded = True
+        # Create sample rooms if table empty
+        c.execute(_SQL_ANY_ROOM)
+        if c.fetchone() is None:
+            c.executemany(_SQL_INSERT_ROOM, _SEED_ROOMS)
+            seeded = True
+    # Gather planner statistics so the Bookings indexes get picked: a full
+    # ANALYZE after seeding or when the database has never been analyzed.
+    # Later refreshes happen in ConnectionPool.shutdown() via PRAGMA optimize
+    c.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+    if seeded or c.fetchone() is None:
+        c.execute("ANALYZE")
+
+def bootstrap_db():
+    """Create the schema and seed data on one pooled connection.
+
+    Safe to run on a worker thread; the connection then returns to the pool
+    with its caches warm for the first screens.
+    """
+    with get_db() as conn:
+        create_tables(conn)
+        seed_data(conn)
 
 # ---------------------------
 # Helpers
 # ---------------------------
-def hash_password(password: str) -> str:
-    return hashlib.sha256(password.encode()).hexdigest()
-
-def verify_password(password: str, password_hash: str) -> bool:
-    return hash_password(password) == password_hash
+PBKDF2_ITERATIONS = 100_000
+_pbkdf2 = hashlib.pbkdf2_hmac
+_sha = hashlib.sha256
+# Hashed against when an email is unknown, so a miss costs as much as a hit
+_DUMMY_SALT = bytes(16)
+
+def new_salt() -> bytes:
+    return os.urandom(16)
+
+def hash_password(password: str, salt: bytes) -> str:
+    return _pbkdf2("sha256", password.encode("utf-8"), salt, PBKDF2_ITERATIONS).hex()
+
+def verify_password(password: str, password_hash: str, salt=None) -> bool:
+    """Check a password; rows without a salt still hold a plain SHA-256 hash.
+
+    The digest comparison is constant-time. Legacy unsalted rows still answer
+    faster than salted ones until their next login upgrades them.
+    """
+    if salt is None:
+        candidate = _sha(password.encode("utf-8")).hexdigest()
+    else:
+        candidate = hash_password(password, salt)
+    return hmac.compare_digest(candidate, password_hash or "")
 
 def parse_date(s: str):
     """Parse date in DD-MM-YYYY format"""
@@ -113,120 +336,371 @@ def parse_date(s: str):
 
 def format_date(d):
     """Format date to DD-MM-YYYY"""
-    if isinstance(d, str):
-        # If it's stored as YYYY-MM-DD in DB, convert it
-        try:
-            dt = datetime.strptime(d, "%Y-%m-%d").date()
-            return dt.strftime("%d-%m-%Y")
-        except:
-            return d
-    elif isinstance(d, date):
-        return d.strftime("%d-%m-%Y")
+    if isinstance(d, date):
+        return f"{d.day:02d}-{d.month:02d}-{d.year}"
+    if isinstance(d, str) and len(d) >= 10 and d[4] == "-":
+        # YYYY-MM-DD text, e.g. from a column without the DATE converter
+        return f"{d[8:10]}-{d[5:7]}-{d[0:4]}"
     return str(d)
 
-def dates_overlap(a_start, a_end, b_start, b_end):
-    """Check if two date ranges overlap (inclusive)"""
-    return not (a_end <= b_start or b_end <= a_start)
-
 # ---------------------------
 # Business logic
 # ---------------------------
+# Only the columns the login flows read
+_LOGIN_COLUMNS = {
+    "Customers": "customer_id, name, password_hash, salt",
+    "Staff": "staff_id, name, password_hash, salt",
+}
+
+@lru_cache(maxsize=64)
+def _lookup_user_row(table, email):
+    """Return the Customers/Staff row for an email (cached; clear on writes)."""
+    return q_one(f"SELECT {_LOGIN_COLUMNS[table]} FROM {table} WHERE email = ?", (email,))
+
+def upgrade_password_hash(table, key_column, key, password):
+    """Re-store a legacy unsalted hash as salted PBKDF2."""
+    salt = new_salt()
+    q_exec(f"UPDATE {table} SET password_hash = ?, salt = ? WHERE {key_column} = ?",
+           (hash_password(password, salt), salt, key))
+    _lookup_user_row.cache_clear()
+
+# room_id -> (sorted check-in dates, running max of check-out dates) for
+# Pending/Confirmed bookings. Built lazily; drop entries whenever bookings change.
+_booking_index = {}
+_booking_index_ready = False
+
+def _index_entry(stays):
+    starts, ends, latest = [], [], None
+    for b_in, b_out in stays:
+        starts.append(b_in)
+        latest = b_out if latest is None or b_out > latest else latest
+        ends.append(latest)
+    return starts, ends
+
+def _room_bookings(room_id):
+    global _booking_index_ready
+    if not _booking_index_ready:
+        grouped = {}
+        for r in q("""
+            SELECT room_id, check_in, check_out FROM Bookings
+            WHERE status IN ('Pending', 'Confirmed')
+            ORDER BY room_id, check_in
+            """):
+            grouped.setdefault(r["room_id"], []).append((r["check_in"], r["check_out"]))
+        _booking_index.clear()
+        _booking_index.update((rid, _index_entry(stays)) for rid, stays in grouped.items())
+        _booking_index_ready = True
+    entry = _booking_index.get(room_id)
+    if entry is None:
+        rows = q("""
+            SELECT check_in, check_out FROM Bookings
+            WHERE room_id = ? AND status IN ('Pending', 'Confirmed')
+            ORDER BY check_in
+            """, (room_id,))
+        entry = _booking_index[room_id] = _index_entry((r["check_in"], r["check_out"]) for r in rows)
+    return entry
+
+def invalidate_booking_index(room_id=None):
+    """Forget cached bookings for one room, or for every room if room_id is None."""
+    global _booking_index_ready
+    if room_id is None:
+        _booking_index.clear()
+        _booking_index_ready = False
+    else:
+        _booking_index.pop(room_id, None)
+
+def invalidate_stats():
+    """Drop the cached dashboard stats after a write that changes them."""
+    _stats_cache.cache_clear()
+
 def check_availability(room_id, check_in, check_out):
-    """Return True if room is available for the date range."""
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("""
-        SELECT * FROM Bookings 
-        WHERE room_id = ? AND status IN ('Pending', 'Confirmed')
-        """, (room_id,))
-    rows = c.fetchall()
-    conn.close()
-    
-    for r in rows:
-        b_in = datetime.strptime(r["check_in"], "%Y-%m-%d").date()
-        b_out = datetime.strptime(r["check_out"], "%Y-%m-%d").date()
-        if dates_overlap(check_in, check_out, b_in, b_out):
-            return False
-    return True
+    """Return True if room is available for the date range.
+
+    Two stays overlap when each starts before the other ends. Bookings
+    starting before check_out are a prefix of the sorted index, so the room
+    is free iff the latest check-out in that prefix is on/before check_in.
+    The index is per-process, so this is a hint for the UI; create_booking
+    re-checks against the database before inserting.
+    """
+    if check_out <= check_in:
+        return False
+    starts, ends = _room_bookings(room_id)
+    i = bisect_left(starts, check_out)
+    return i == 0 or ends[i - 1] <= check_in
 
 def find_available_rooms(check_in, check_out, room_type=None):
     """Find available rooms for given date range and optional room type filter."""
-    conn = get_db()
-    c = conn.cursor()
+    if check_out <= check_in:
+        return []
+    if not room_type or room_type == "All":
+        room_type = None
     
-    if room_type and room_type != "All":
-        c.execute("SELECT * FROM Rooms WHERE status != 'Maintenance' AND room_type = ?", (room_type,))
-    else:
-        c.execute("SELECT * FROM Rooms WHERE status != 'Maintenance'")
-    
-    rooms = c.fetchall()
-    conn.close()
-    
-    available = []
-    for r in rooms:
-        if check_availability(r["room_id"], check_in, check_out):
-            available.append(r)
-    return available
+    return q("""
+        SELECT r.room_id, r.room_number, r.room_type, r.price_per_night, r.description
+        FROM Rooms r
+        WHERE r.status != 'Maintenance'
+          AND (? IS NULL OR r.room_type = ?)
+          AND NOT EXISTS (
+              SELECT 1 FROM Bookings b
+              WHERE b.room_id = r.room_id AND b.status IN ('Pending', 'Confirmed')
+                AND b.check_in < ? AND b.check_out > ?
+          )
+        """, (room_type, room_type, check_out.isoformat(), check_in.isoformat()))
 
 def create_booking(customer_id, room_id, check_in, check_out):
-    """Create a new booking."""
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("INSERT INTO Bookings (customer_id, room_id, check_in, check_out, status) VALUES (?,?,?,?,?)",
-              (customer_id, room_id, check_in.isoformat(), check_out.isoformat(), "Pending"))
-    booking_id = c.lastrowid
-    conn.commit()
-    conn.close()
-    return booking_id
+    """Create a new booking.
+
+    Returns (booking_id, price_per_night, room_number) so callers can show
+    the confirmation without another lookup. Raises ValueError if the room
+    is already booked for an overlapping stay.
+    """
+    if check_out <= check_in:
+        raise ValueError("check_out must be after check_in")
+    ci, co = check_in.isoformat(), check_out.isoformat()
+    with get_db() as conn:
+        c = conn.cursor()
+        # Take the write lock before checking so no other writer, in this or
+        # another process, can book the room between the check and the insert
+        with conn:
+            c.execute("BEGIN IMMEDIATE")
+            c.execute("""
+                SELECT 1 FROM Bookings
+                WHERE room_id = ? AND status IN ('Pending', 'Confirmed')
+                  AND check_in < ? AND check_out > ?
+                LIMIT 1
+            """, (room_id, co, ci))
+            if c.fetchone() is not None:
+                raise ValueError("Room no longer available. Please search again.")
+            c.execute("INSERT INTO Bookings (customer_id, room_id, check_in, check_out, status) VALUES (?,?,?,?,?)",
+                      (customer_id, room_id, ci, co, "Pending"))
+            booking_id = c.lastrowid
+            c.execute("SELECT price_per_night, room_number FROM Rooms WHERE room_id = ?", (room_id,))
+            r = c.fetchone()
+    invalidate_booking_index(room_id)
+    invalidate_stats()
+    return booking_id, r["price_per_night"], r["room_number"]
+
+def record_payments_bulk(rows):
+    """Record (booking_id, amount, mode) payments and confirm their bookings in one transaction."""
+    rows = list(rows)
+    with get_db() as conn, conn:
+        conn.executemany("""
+            INSERT INTO Payments (booking_id, customer_id, amount, payment_mode)
+            SELECT booking_id, customer_id, ?, ? FROM Bookings WHERE booking_id = ?
+        """, [(amount, mode, booking_id) for booking_id, amount, mode in rows])
+        conn.executemany("UPDATE Bookings SET status = 'Confirmed' WHERE booking_id = ?",
+                         [(booking_id,) for booking_id, _, _ in rows])
+    invalidate_stats()
 
 def record_payment(booking_id, amount, mode):
-    """Record a payment and update booking status."""
-    conn = get_db()
-    c = conn.cursor()
-    c.execute("INSERT INTO Payments (booking_id, amount, payment_mode) VALUES (?,?,?)",
-              (booking_id, amount, mode))
-    c.execute("UPDATE Bookings SET status = 'Confirmed' WHERE booking_id = ?", (booking_id,))
-    conn.commit()
-    conn.close()
+    """Record a payment and update booking status in one transaction."""
+    record_payments_bulk([(booking_id, amount, mode)])
+
+# Dashboard stats are reused for this many seconds unless a write clears them
+_STATS_TTL = 5.0
+
+@lru_cache(maxsize=1)
+def _stats_cache(bucket):
+    """Stats for one _STATS_TTL time bucket; a new bucket misses and re-queries."""
+    # SQLite evaluates comparisons to 0/1, so SUM counts matches
+    return dict(q_one("""
+        SELECT r.total_rooms, r.available_rooms,
+               b.total_bookings, b.pending_bookings, b.confirmed_bookings,
+               (SELECT COALESCE(SUM(amount), 0) FROM Payments) AS total_revenue
+        FROM (SELECT COUNT(*) AS total_rooms,
+                     COALESCE(SUM(status = 'Available'), 0) AS available_rooms
+              FROM Rooms) r,
+             (SELECT COUNT(*) AS total_bookings,
+                     COALESCE(SUM(status = 'Pending'), 0) AS pending_bookings,
+                     COALESCE(SUM(status = 'Confirmed'), 0) AS confirmed_bookings
+              FROM Bookings) b
+    """))
 
 def get_dashboard_stats():
-    """Get statistics for admin dashboard."""
-    conn = get_db()
-    c = conn.cursor()
-    
-    stats = {}
-    
-    # Total rooms
-    c.execute("SELECT COUNT(*) as cnt FROM Rooms")
-    stats['total_rooms'] = c.fetchone()['cnt']
-    
-    # Available rooms
-    c.execute("SELECT COUNT(*) as cnt FROM Rooms WHERE status = 'Available'")
-    stats['available_rooms'] = c.fetchone()['cnt']
-    
-    # Total bookings
-    c.execute("SELECT COUNT(*) as cnt FROM Bookings")
-    stats['total_bookings'] = c.fetchone()['cnt']
-    
-    # Pending bookings
-    c.execute("SELECT COUNT(*) as cnt FROM Bookings WHERE status = 'Pending'")
-    stats['pending_bookings'] = c.fetchone()['cnt']
-    
-    # Confirmed bookings
-    c.execute("SELECT COUNT(*) as cnt FROM Bookings WHERE status = 'Confirmed'")
-    stats['confirmed_bookings'] = c.fetchone()['cnt']
-    
-    # Total revenue
-    c.execute("SELECT SUM(amount) as total FROM Payments")
-    result = c.fetchone()
-    stats['total_revenue'] = result['total'] if result['total'] else 0
-    
-    conn.close()
-    return stats
+    """Get statistics for admin dashboard, cached for up to _STATS_TTL seconds."""
+    return dict(_stats_cache(int(time.monotonic() // _STATS_TTL)))
 
 # ---------------------------
 # GUI
 # ---------------------------
+PAGE_SIZE = 100
+
+# Queries behind the paged screens. Kept as constants so each connection's
+# statement cache sees the exact same text on every load.
+_SQL_COUNT_MY_BOOKINGS = "SELECT COUNT(*) AS cnt FROM Bookings WHERE customer_id = ?"
+_SQL_MY_BOOKINGS = """
+    SELECT b.booking_id, r.room_number, b.check_in, b.check_out, b.status,
+           CASE WHEN EXISTS (SELECT 1 FROM Payments p WHERE p.booking_id = b.booking_id)
+                THEN 'Paid' ELSE 'Pending' END as payment_status
+    FROM Bookings b 
+    JOIN Rooms r ON b.room_id = r.room_id
+    WHERE b.customer_id = ?
+    ORDER BY b.created_at DESC
+    LIMIT ? OFFSET ?
+"""
+_SQL_BOOKING_TOTAL = """
+    SELECT (julianday(b.check_out) - julianday(b.check_in)) * r.price_per_night AS total
+    FROM Bookings b 
+    JOIN Rooms r ON b.room_id = r.room_id 
+    WHERE b.booking_id = ?
+"""
+_SQL_COUNT_ROOMS = "SELECT COUNT(*) AS cnt FROM Rooms"
+_SQL_ROOMS_PAGE = "SELECT * FROM Rooms ORDER BY room_number LIMIT ? OFFSET ?"
+_SQL_COUNT_BOOKINGS = "SELECT COUNT(*) AS cnt FROM Bookings"
+_SQL_ALL_BOOKINGS = """
+    SELECT b.booking_id, cust.name as customer, r.room_number as room, 
+           b.check_in, b.check_out, b.status
+    FROM Bookings b
+    LEFT JOIN Customers cust ON b.customer_id = cust.customer_id
+    LEFT JOIN Rooms r ON b.room_id = r.room_id
+    ORDER BY b.created_at DESC
+    LIMIT ? OFFSET ?
+"""
+_SQL_PAYMENT_TOTALS = "SELECT COUNT(*) AS cnt, COALESCE(SUM(amount), 0) AS revenue FROM Payments"
+_SQL_PAYMENTS = """
+    SELECT p.payment_id, p.booking_id, c.name as customer, 
+           p.amount, p.payment_date, p.payment_mode
+    FROM Payments p
+    LEFT JOIN Customers c ON p.customer_id = c.customer_id
+    ORDER BY p.payment_date DESC
+    LIMIT ? OFFSET ?
+"""
+
+class Pager:
+    """Prev/Next controls that page a Treeview loader through LIMIT/OFFSET."""
+
+    def __init__(self, parent, on_change, bg):
+        self.page = 0
+        self.pages = 1
+        self._on_change = on_change
+        
+        bar = tk.Frame(parent, bg=bg)
+        bar.pack(pady=(0, 5))
+        self._prev = ttk.Button(bar, text="◀ Prev", command=lambda: self._go(-1))
+        self._prev.pack(side='left', padx=5)
+        self._label = tk.Label(bar, font=("Arial", 9), bg=bg)
+        self._label.pack(side='left', padx=10)
+        self._next = ttk.Button(bar, text="Next ▶", command=lambda: self._go(1))
+        self._next.pack(side='left', padx=5)
+
+    @staticmethod
+    def page_count(total):
+        return max(1, -(-total // PAGE_SIZE))
+
+    @staticmethod
+    def offset_for(page, total):
+        """OFFSET for page, clamped to the last page of total rows.
+
+        Touches no widgets, so loaders can call it from a worker thread.
+        """
+        return min(page, Pager.page_count(total) - 1) * PAGE_SIZE
+
+    def set_total(self, total):
+        """Record the total row count, keeping the current page in range."""
+        self.pages = self.page_count(total)
+        self.page = min(self.page, self.pages - 1)
+        self._label.config(text=f"Page {self.page + 1} of {self.pages}")
+        self._prev.state(["!disabled" if self.page > 0 else "disabled"])
+        self._next.state(["!disabled" if self.page < self.pages - 1 else "disabled"])
+
+    def _go(self, step):
+        self.page = min(max(self.page + step, 0), self.pages - 1)
+        self._on_change()
+
+class LazyTree:
+    """Keep fetched rows in a list and insert them into a Treeview as it scrolls.
+
+    Only the first chunk is rendered up front; the next chunk is inserted
+    whenever the visible region passes 80% of what has been rendered so far.
+    ``values`` turns a database row into the tuple shown in the table; loaders
+    apply it while fetching (see q_map) and hand set_rows the finished tuples.
+    Items are keyed by their first column (the row's id), which lets set_rows
+    diff a reload against what is on screen instead of redrawing it.
+    """
+
+    CHUNK = 50
+
+    def __init__(self, tree, scrollbar, values):
+        self.tree = tree
+        self._scrollbar = scrollbar
+        self.values = values
+        self._rows = []
+        self._rendered = 0
+        self._row_labels = {}  # iid -> values currently shown in the tree
+        tree.configure(yscrollcommand=self._on_scroll)
+        tree.bind("<<TreeviewOpen>>", lambda e: self._maybe_render())
+
+    @staticmethod
+    def _iid(values):
+        return str(values[0])
+
+    def set_rows(self, rows):
+        """Replace the rows, touching only tree items that were added, removed or changed."""
+        self._rows = list(rows)
+        # Keep as many rows on screen as before so a refresh doesn't jump
+        shown = self._rows[:max(self._rendered, self.CHUNK)]
+        new = {self._iid(v): v for v in shown}
+        old = self._row_labels
+        tree = self.tree
+        
+        gone = [iid for iid in old if iid not in new]
+        if gone:
+            tree.delete(*gone)
+        
+        order = list(new)
+        kept_before = list(tree.get_children())
+        kept_after = [iid for iid in order if iid in old]
+        for i, iid in enumerate(order):
+            v = new[iid]
+            if iid not in old:
+                tree.insert("", i, iid=iid, values=v)
+            elif old[iid] != v:
+                tree.item(iid, values=v)
+        # Surviving rows only need moving if their relative order changed
+        if kept_before != kept_after:
+            for i, iid in enumerate(order):
+                tree.move(iid, "", i)
+        
+        self._row_labels = new
+        self._rendered = len(shown)
+
+    def render_initial(self, count=CHUNK):
+        if self._rendered < count:
+            self.render_more(count - self._rendered)
+
+    def render_more(self, count=CHUNK):
+        end = min(self._rendered + count, len(self._rows))
+        chunk = self._rows[self._rendered:end]
+        iids = [self._iid(v) for v in chunk]
+        insert = self.tree.insert
+        for iid, v in zip(iids, chunk):
+            insert("", tk.END, iid=iid, values=v)
+        self._row_labels.update(zip(iids, chunk))
+        self._rendered = end
+
+    # In-place edits after a write, so the page needn't be re-queried.
+    # Edited items are always rendered, so their tree index is their list index.
+
+    def update_row(self, iid, values):
+        self._rows[self.tree.index(iid)] = values
+        self._row_labels[iid] = values
+        self.tree.item(iid, values=values)
+
+    def set_cell(self, iid, column, value):
+        values = list(self._row_labels[iid])
+        values[self.tree["columns"].index(column)] = value
+        self.update_row(iid, tuple(values))
+
+    def _maybe_render(self):
+        if self._rendered < len(self._rows) and self.tree.yview()[1] > 0.8:
+            self.render_more()
+
+    def _on_scroll(self, first, last):
+        self._scrollbar.set(first, last)
+        if self._rendered < len(self._rows) and float(last) > 0.8:
+            # Defer so the insert doesn't run inside Tk's scroll callback
+            self.tree.after_idle(self._maybe_render)
+
 
 class HotelApp(tk.Tk):
     def __init__(self):
@@ -254,10 +728,31 @@ class HotelApp(tk.Tk):
         self.main_frame = ttk.Frame(self)
         self.main_frame.pack(fill="both", expand=True)
         
+        # Screens are built once and swapped in and out by _show()
+        self._frames = {}
+        self._on_show = {}
+        self._current = None
+        
+        # Table loads run here so SQLite I/O never blocks the mainloop
+        self._db_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="db")
+        self._async_latest = {}
+        # Loaders queued by _schedule_load but not yet run
+        self._load_pending = set()
+        
         # Configure styles
         self.setup_styles()
         
-        self.show_welcome()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Paint a splash right away and prepare the database off the mainloop
+        self._show("splash", self._build_splash)
+        self._async_call(bootstrap_db, self._on_bootstrapped, on_error=self._on_bootstrap_failed)
+
+    def on_close(self):
+        """Release pooled database connections before the window goes away."""
+        self._db_executor.shutdown(wait=False, cancel_futures=True)
+        _POOL.shutdown()
+        self.destroy()
 
     def setup_styles(self):
         """Setup custom ttk styles."""
@@ -289,14 +784,99 @@ class HotelApp(tk.Tk):
                        fieldbackground='white')
         style.map('Treeview', background=[('selected', self.colors['secondary'])])
 
-    def clear(self):
-        """Clear all widgets from main frame."""
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
+    def _show(self, name, build):
+        """Switch to a screen, building its widgets only on first use.
+
+        build(frame) fills the screen's frame and may return a callback that
+        refreshes it each time the screen is shown.
+        """
+        frame = self._frames.get(name)
+        if frame is None:
+            frame = ttk.Frame(self.main_frame)
+            self._on_show[name] = build(frame)
+            self._frames[name] = frame
+        if self._current is not None:
+            self._current.pack_forget()
+        frame.pack(fill="both", expand=True)
+        self._current = frame
+        if self._on_show[name]:
+            self._on_show[name]()
+
+    def verify_in_background(self, password, row, on_done):
+        """Check a login password on a worker thread, then call on_done(ok) on the Tk thread.
+
+        PBKDF2 is deliberately slow; only the hash runs off the main thread,
+        the (cached) row lookup stays with the caller.
+        """
+        def work():
+            if row is None:
+                # Pay the PBKDF2 cost anyway so unknown emails aren't faster to reject
+                hash_password(password, _DUMMY_SALT)
+                ok = False
+            else:
+                ok = verify_password(password, row["password_hash"], row["salt"])
+            self.after(0, on_done, ok)
+        
+        threading.Thread(target=work, daemon=True).start()
+
+    def _async_call(self, fn, on_done, key=None, on_error=None):
+        """Run fn() on the DB worker pool, then call on_done(result) on the Tk thread.
+
+        If fn() raises, on_error(exc) runs on the Tk thread instead; without
+        on_error the exception is shown in a message box. With a key, only the
+        latest call for that key reports back, so a slow earlier load can't
+        overwrite a newer one.
+        """
+        token = object()
+        if key is not None:
+            self._async_latest[key] = token
+        
+        def current():
+            return key is None or self._async_latest.get(key) is token
+        
+        def deliver(result):
+            if current():
+                on_done(result)
+        
+        def fail(exc):
+            if not current():
+                return
+            if on_error is not None:
+                on_error(exc)
+            else:
+                title = "Database Error" if isinstance(exc, sqlite3.Error) else "Error"
+                messagebox.showerror(title, str(exc))
+        
+        def work():
+            try:
+                result = fn()
+            except Exception as e:
+                self.after(0, fail, e)
+                return
+            self.after(0, deliver, result)
+        
+        def check(future):
+            # Only reached if posting back to Tk failed (e.g. the window closed)
+            exc = future.exception()
+            if exc is not None:
+                traceback.print_exception(exc)
+        
+        self._db_executor.submit(work).add_done_callback(check)
+
+    def _schedule_load(self, load):
+        """Run load() at the next idle point, dropping repeat requests until then."""
+        if load in self._load_pending:
+            return
+        self._load_pending.add(load)
+        self.after_idle(self._run_load, load)
+
+    def _run_load(self, load):
+        self._load_pending.discard(load)
+        load()
 
-    def create_header(self, text, subtitle=""):
-        """Create a styled header."""
-        header_frame = tk.Frame(self.main_frame, bg=self.colors['primary'], height=80)
+    def create_header(self, parent, text, subtitle=""):
+        """Create a styled header and return its title label."""
+        header_frame = tk.Frame(parent, bg=self.colors['primary'], height=80)
         header_frame.pack(fill="x", pady=(0, 10))
         header_frame.pack_propagate(False)
         
@@ -312,18 +892,42 @@ class HotelApp(tk.Tk):
                           bg=self.colors['primary'],
                           fg=self.colors['light'])
             sub.pack()
+        
+        return title
 
     # -----------
     # Welcome Screen
     # -----------
+    def _build_splash(self, frame):
+        self.create_header(frame, "🏨 Grand Hotel Booking System", "Your Comfort, Our Priority")
+        content = tk.Frame(frame, bg=self.colors['light'])
+        content.pack(expand=True, fill='both')
+        tk.Label(content, text="Loading…",
+                font=("Arial", 14),
+                bg=self.colors['light'],
+                fg=self.colors['dark']).pack(expand=True)
+
+    def _on_bootstrapped(self, _):
+        self.show_welcome()
+        # The splash is never shown again
+        self._frames.pop("splash").destroy()
+        del self._on_show["splash"]
+
+    def _on_bootstrap_failed(self, exc):
+        # Nothing works without the database, so report it and exit
+        messagebox.showerror("Database Error",
+            f"Could not prepare the database:\n{exc}\n\nThe application will now close.")
+        self.on_close()
+
     def show_welcome(self):
-        self.clear()
-        
+        self._show("welcome", self._build_welcome)
+
+    def _build_welcome(self, frame):
         # Header
-        self.create_header("🏨 Grand Hotel Booking System", "Your Comfort, Our Priority")
+        self.create_header(frame, "🏨 Grand Hotel Booking System", "Your Comfort, Our Priority")
         
         # Main content
-        content = tk.Frame(self.main_frame, bg=self.colors['light'])
+        content = tk.Frame(frame, bg=self.colors['light'])
         content.pack(expand=True, fill='both', padx=40, pady=20)
         
         # Welcome message
@@ -381,7 +985,7 @@ class HotelApp(tk.Tk):
                 fg='gray').pack()
         
         # Footer
-        footer = tk.Label(self.main_frame,
+        footer = tk.Label(frame,
                          text="© 2024 Grand Hotel - All Rights Reserved",
                          font=("Arial", 9),
                          bg=self.colors['light'],
@@ -392,11 +996,13 @@ class HotelApp(tk.Tk):
     # User Registration
     # -----------
     def show_register(self):
-        self.clear()
-        self.create_header("Create Account", "Join us for exclusive benefits")
+        self._show("register", self._build_register)
+
+    def _build_register(self, frame):
+        self.create_header(frame, "Create Account", "Join us for exclusive benefits")
         
         # Form container
-        form_container = tk.Frame(self.main_frame, bg='white')
+        form_container = tk.Frame(frame, bg='white')
         form_container.pack(pady=30, padx=200)
         form_container.configure(relief='raised', borderwidth=2)
         
@@ -434,18 +1040,16 @@ class HotelApp(tk.Tk):
                 messagebox.showerror("Error", "Password must be at least 6 characters")
                 return
             
-            conn = get_db()
-            c = conn.cursor()
+            salt = new_salt()
             try:
-                c.execute("INSERT INTO Customers (name,email,phone,password_hash) VALUES (?,?,?,?)",
-                          (name, email, phone, hash_password(pw)))
-                conn.commit()
-                messagebox.showinfo("Success", "Registration successful! Please login.")
-                self.show_login()
+                q_exec("INSERT INTO Customers (name,email,phone,password_hash,salt) VALUES (?,?,?,?,?)",
+                       (name, email, phone, hash_password(pw, salt), salt))
             except sqlite3.IntegrityError:
                 messagebox.showerror("Error", "Email already registered")
-            finally:
-                conn.close()
+                return
+            _lookup_user_row.cache_clear()
+            messagebox.showinfo("Success", "Registration successful! Please login.")
+            self.show_login()
 
         # Buttons
         btn_frame = tk.Frame(form, bg='white')
@@ -455,15 +1059,23 @@ class HotelApp(tk.Tk):
                   style='Success.TButton', width=15).pack(side='left', padx=5)
         ttk.Button(btn_frame, text="Back", command=self.show_welcome,
                   width=15).pack(side='left', padx=5)
+        
+        def on_show():
+            for entry in entries.values():
+                entry.delete(0, "end")
+        
+        return on_show
 
     # -----------
     # User Login
     # -----------
     def show_login(self):
-        self.clear()
-        self.create_header("Customer Login", "Access your bookings")
+        self._show("login", self._build_login)
+
+    def _build_login(self, frame):
+        self.create_header(frame, "Customer Login", "Access your bookings")
         
-        form_container = tk.Frame(self.main_frame, bg='white')
+        form_container = tk.Frame(frame, bg='white')
         form_container.pack(pady=40, padx=250)
         form_container.configure(relief='raised', borderwidth=2)
         
@@ -486,18 +1098,19 @@ class HotelApp(tk.Tk):
                 messagebox.showerror("Error", "Please enter email and password")
                 return
             
-            conn = get_db()
-            c = conn.cursor()
-            c.execute("SELECT * FROM Customers WHERE email = ?", (email,))
-            row = c.fetchone()
-            conn.close()
+            row = _lookup_user_row("Customers", email)
             
-            if row and verify_password(pw, row["password_hash"]):
-                self.user = row
-                messagebox.showinfo("Success", f"Welcome back, {row['name']}!")
-                self.show_user_dashboard()
-            else:
-                messagebox.showerror("Error", "Invalid email or password")
+            def finish(ok):
+                if ok:
+                    if row["salt"] is None:
+                        upgrade_password_hash("Customers", "customer_id", row["customer_id"], pw)
+                    self.user = row
+                    messagebox.showinfo("Success", f"Welcome back, {row['name']}!")
+                    self.show_user_dashboard()
+                else:
+                    messagebox.showerror("Error", "Invalid email or password")
+            
+            self.verify_in_background(pw, row, finish)
 
         btn_frame = tk.Frame(form, bg='white')
         btn_frame.grid(row=2, column=0, columnspan=2, pady=20)
@@ -506,15 +1119,23 @@ class HotelApp(tk.Tk):
                   style='Success.TButton', width=15).pack(side='left', padx=5)
         ttk.Button(btn_frame, text="Back", command=self.show_welcome,
                   width=15).pack(side='left', padx=5)
+        
+        def on_show():
+            email_e.delete(0, "end")
+            pw_e.delete(0, "end")
+        
+        return on_show
 
     # -----------
     # Admin Login
     # -----------
     def show_admin_login(self):
-        self.clear()
-        self.create_header("Admin Login", "Management Portal Access")
+        self._show("admin_login", self._build_admin_login)
+
+    def _build_admin_login(self, frame):
+        self.create_header(frame, "Admin Login", "Management Portal Access")
         
-        form_container = tk.Frame(self.main_frame, bg='white')
+        form_container = tk.Frame(frame, bg='white')
         form_container.pack(pady=40, padx=250)
         form_container.configure(relief='raised', borderwidth=2)
         
@@ -532,18 +1153,19 @@ class HotelApp(tk.Tk):
         def do_login():
             email = email_e.get().strip().lower()
             pw = pw_e.get()
-            conn = get_db()
-            c = conn.cursor()
-            c.execute("SELECT * FROM Staff WHERE email = ?", (email,))
-            row = c.fetchone()
-            conn.close()
+            row = _lookup_user_row("Staff", email)
             
-            if row and verify_password(pw, row["password_hash"]):
-                self.staff = row
-                messagebox.showinfo("Success", f"Welcome, {row['name']}!")
-                self.show_admin_dashboard()
-            else:
-                messagebox.showerror("Error", "Invalid admin credentials")
+            def finish(ok):
+                if ok:
+                    if row["salt"] is None:
+                        upgrade_password_hash("Staff", "staff_id", row["staff_id"], pw)
+                    self.staff = row
+                    messagebox.showinfo("Success", f"Welcome, {row['name']}!")
+                    self.show_admin_dashboard()
+                else:
+                    messagebox.showerror("Error", "Invalid admin credentials")
+            
+            self.verify_in_background(pw, row, finish)
 
         btn_frame = tk.Frame(form, bg='white')
         btn_frame.grid(row=2, column=0, columnspan=2, pady=20)
@@ -552,16 +1174,26 @@ class HotelApp(tk.Tk):
                   style='Success.TButton', width=15).pack(side='left', padx=5)
         ttk.Button(btn_frame, text="Back", command=self.show_welcome,
                   width=15).pack(side='left', padx=5)
+        
+        def on_show():
+            email_e.delete(0, "end")
+            pw_e.delete(0, "end")
+        
+        return on_show
 
     # -----------
     # Guest Browse Rooms
     # -----------
     def show_browse_guest(self):
-        self.clear()
-        self.create_header("Browse Available Rooms", "Find your perfect stay")
+        self._show("browse_guest", self._build_browse_guest)
+
+    def _build_browse_guest(self, frame):
+        from tkcalendar import DateEntry
+        
+        self.create_header(frame, "Browse Available Rooms", "Find your perfect stay")
         
         # Search frame
-        search_frame = tk.Frame(self.main_frame, bg='white', padx=20, pady=15)
+        search_frame = tk.Frame(frame, bg='white', padx=20, pady=15)
         search_frame.pack(fill="x", padx=20, pady=(0, 10))
         
         tk.Label(search_frame, text="Check-in:", font=("Arial", 10), bg='white').grid(row=0, column=0, padx=5)
@@ -580,7 +1212,7 @@ class HotelApp(tk.Tk):
         room_type_combo.grid(row=0, column=5, padx=5)
         
         # Results frame
-        results_frame = tk.Frame(self.main_frame, bg='white')
+        results_frame = tk.Frame(frame, bg='white')
         results_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
         # Treeview
@@ -613,39 +1245,40 @@ class HotelApp(tk.Tk):
             room_type = room_type_var.get()
             rooms = find_available_rooms(start, end, room_type)
             
-            for i in tree.get_children():
-                tree.delete(i)
+            tree.delete(*tree.get_children())
             
             if not rooms:
                 messagebox.showinfo("No Rooms", "No rooms available for selected dates and type")
                 return
             
-            for r in rooms:
-                tree.insert("", "end", values=(
-                    r["room_number"], 
-                    r["room_type"], 
-                    f"₹{r['price_per_night']:.2f}", 
-                    r["description"]
-                ))
+            rows = [(r["room_number"], r["room_type"], f"₹{r['price_per_night']:.2f}", r["description"])
+                    for r in rooms]
+            for values in rows:
+                tree.insert("", "end", values=values)
             
             messagebox.showinfo("Search Results", f"Found {len(rooms)} available room(s)")
 
-        btn_frame = tk.Frame(self.main_frame, bg=self.colors['light'])
+        btn_frame = tk.Frame(frame, bg=self.colors['light'])
         btn_frame.pack(pady=10)
         
         ttk.Button(btn_frame, text="🔍 Search", command=search,
                   style='Primary.TButton').pack(side='left', padx=5)
         ttk.Button(btn_frame, text="Back", command=self.show_welcome).pack(side='left', padx=5)
+        
+        # Results may be stale by the next visit
+        return lambda: tree.delete(*tree.get_children())
 
     # -----------
     # User Dashboard
     # -----------
     def show_user_dashboard(self):
-        self.clear()
-        self.create_header(f"Welcome, {self.user['name']}", "Manage your bookings")
+        self._show("user_dashboard", self._build_user_dashboard)
+
+    def _build_user_dashboard(self, frame):
+        title = self.create_header(frame, "", "Manage your bookings")
         
         # Quick actions
-        actions = tk.Frame(self.main_frame, bg=self.colors['light'])
+        actions = tk.Frame(frame, bg=self.colors['light'])
         actions.pack(pady=20)
         
         ttk.Button(actions, text="🏨 Browse & Book Rooms", 
@@ -659,6 +1292,8 @@ class HotelApp(tk.Tk):
         ttk.Button(actions, text="🚪 Logout", 
                   command=self.do_logout,
                   width=25).pack(side='left', padx=10)
+        
+        return lambda: title.config(text=f"Welcome, {self.user['name']}")
 
     def do_logout(self):
         self.user = None
@@ -670,11 +1305,15 @@ class HotelApp(tk.Tk):
     # Browse and Book
     # -----------
     def show_browse_and_book(self):
-        self.clear()
-        self.create_header("Book Your Room", "Find and reserve your perfect accommodation")
+        self._show("browse_and_book", self._build_browse_and_book)
+
+    def _build_browse_and_book(self, frame):
+        from tkcalendar import DateEntry
+        
+        self.create_header(frame, "Book Your Room", "Find and reserve your perfect accommodation")
         
         # Search criteria
-        search_frame = tk.Frame(self.main_frame, bg='white', padx=20, pady=15)
+        search_frame = tk.Frame(frame, bg='white', padx=20, pady=15)
         search_frame.pack(fill="x", padx=20, pady=(0, 10))
         
         tk.Label(search_frame, text="Check-in:", font=("Arial", 10), bg='white').grid(row=0, column=0, padx=5)
@@ -693,7 +1332,7 @@ class HotelApp(tk.Tk):
         room_type_combo.grid(row=0, column=5, padx=5)
         
         # Results
-        results_frame = tk.Frame(self.main_frame, bg='white')
+        results_frame = tk.Frame(frame, bg='white')
         results_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
         columns = ("id", "num", "type", "price", "desc")
@@ -727,21 +1366,18 @@ class HotelApp(tk.Tk):
             room_type = room_type_var.get()
             rooms = find_available_rooms(start, end, room_type)
             
-            for i in tree.get_children():
-                tree.delete(i)
+            tree.delete(*tree.get_children())
             
             if not rooms:
                 messagebox.showinfo("No Rooms", "No rooms available for selected dates and type")
                 return
             
-            for r in rooms:
-                tree.insert("", "end", iid=str(r["room_id"]), values=(
-                    r["room_id"],
-                    r["room_number"], 
-                    r["room_type"], 
-                    f"₹{r['price_per_night']:.2f}", 
-                    r["description"]
-                ))
+            rows = [(str(r["room_id"]),
+                     (r["room_id"], r["room_number"], r["room_type"],
+                      f"₹{r['price_per_night']:.2f}", r["description"]))
+                    for r in rooms]
+            for iid, values in rows:
+                tree.insert("", "end", iid=iid, values=values)
             
             tree._checkin = start
             tree._checkout = end
@@ -761,19 +1397,16 @@ class HotelApp(tk.Tk):
                 messagebox.showerror("Error", "Room no longer available. Please search again.")
                 return
             
-            # Create booking
-            booking_id = create_booking(self.user["customer_id"], room_id, start, end)
+            # Create booking (re-checked against the database)
+            try:
+                booking_id, price, room_num = create_booking(self.user["customer_id"], room_id, start, end)
+            except ValueError as e:
+                invalidate_booking_index(room_id)
+                messagebox.showerror("Error", str(e))
+                return
             
             # Calculate total
             total_nights = (end - start).days
-            conn = get_db()
-            c = conn.cursor()
-            c.execute("SELECT price_per_night, room_number FROM Rooms WHERE room_id = ?", (room_id,))
-            r = c.fetchone()
-            price = r["price_per_night"]
-            room_num = r["room_number"]
-            conn.close()
-            
             total_amount = price * total_nights
             
             proceed = messagebox.askyesno("Confirm Booking", 
@@ -792,7 +1425,7 @@ class HotelApp(tk.Tk):
                     "You can complete payment from 'My Bookings'.")
                 self.show_my_bookings()
 
-        btn_frame = tk.Frame(self.main_frame, bg=self.colors['light'])
+        btn_frame = tk.Frame(frame, bg=self.colors['light'])
         btn_frame.pack(pady=10)
         
         ttk.Button(btn_frame, text="🔍 Search", command=search,
@@ -800,6 +1433,9 @@ class HotelApp(tk.Tk):
         ttk.Button(btn_frame, text="✅ Book Selected", command=book_selected,
                   style='Success.TButton').pack(side='left', padx=5)
         ttk.Button(btn_frame, text="Back", command=self.show_user_dashboard).pack(side='left', padx=5)
+        
+        # Results may be stale by the next visit
+        return lambda: tree.delete(*tree.get_children())
 
     # -----------
     # Payment Window
@@ -835,23 +1471,19 @@ class HotelApp(tk.Tk):
                 font=("Arial", 11),
                 bg='white').pack(pady=10)
         
-        var = tk.StringVar()
-        
-        payment_methods = [
+        payment_methods = dict([
             ("💳 Credit/Debit Card", "Card"),
             ("📱 UPI Payment", "UPI"),
             ("💵 Cash on Arrival", "Cash"),
             ("🏦 Net Banking", "NetBanking")
-        ]
+        ])
         
-        for text, value in payment_methods:
-            rb = tk.Radiobutton(content, text=text, variable=var, value=value,
-                               font=("Arial", 10), bg='white',
-                               selectcolor=self.colors['light'])
-            rb.pack(anchor='w', padx=20, pady=5)
+        method_combo = ttk.Combobox(content, values=list(payment_methods),
+                                    state='readonly', width=28)
+        method_combo.pack(pady=5)
 
         def do_pay():
-            mode = var.get()
+            mode = payment_methods.get(method_combo.get())
             if not mode:
                 messagebox.showerror("Error", "Please select a payment method")
                 return
@@ -876,11 +1508,13 @@ class HotelApp(tk.Tk):
     # My Bookings
     # -----------
     def show_my_bookings(self):
-        self.clear()
-        self.create_header("My Bookings", "View and manage your reservations")
+        self._show("my_bookings", self._build_my_bookings)
+
+    def _build_my_bookings(self, frame):
+        self.create_header(frame, "My Bookings", "View and manage your reservations")
         
         # Bookings list
-        list_frame = tk.Frame(self.main_frame, bg='white')
+        list_frame = tk.Frame(frame, bg='white')
         list_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
         columns = ("id", "room", "in", "out", "status", "paid")
@@ -905,33 +1539,34 @@ class HotelApp(tk.Tk):
         
         tree.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
+        
+        pager = Pager(frame, lambda: load(), self.colors['light'])
+        _fd = format_date
+        lazy = LazyTree(tree, scrollbar, lambda r: (
+            r["booking_id"], 
+            r["room_number"], 
+            _fd(r["check_in"]), 
+            _fd(r["check_out"]), 
+            r["status"],
+            r["payment_status"]
+        ))
 
         def load():
-            for i in tree.get_children():
-                tree.delete(i)
+            customer_id = self.user["customer_id"]
+            page = pager.page
             
-            conn = get_db()
-            c = conn.cursor()
-            c.execute("""
-                SELECT b.booking_id, r.room_number, b.check_in, b.check_out, b.status,
-                       CASE WHEN p.payment_id IS NOT NULL THEN 'Paid' ELSE 'Pending' END as payment_status
-                FROM Bookings b 
-                JOIN Rooms r ON b.room_id = r.room_id
-                LEFT JOIN Payments p ON b.booking_id = p.booking_id
-                WHERE b.customer_id = ?
-                ORDER BY b.created_at DESC
-            """, (self.user["customer_id"],))
-            
-            for r in c.fetchall():
-                tree.insert("", "end", values=(
-                    r["booking_id"], 
-                    r["room_number"], 
-                    format_date(r["check_in"]), 
-                    format_date(r["check_out"]), 
-                    r["status"],
-                    r["payment_status"]
-                ))
-            conn.close()
+            def fetch():
+                total = q_one(_SQL_COUNT_MY_BOOKINGS, (customer_id,))["cnt"]
+                return total, q_map(lazy.values, _SQL_MY_BOOKINGS,
+                                    (customer_id, PAGE_SIZE, Pager.offset_for(page, total)))
+            
+            self._async_call(fetch, populate, key="my_bookings")
+
+        def populate(result):
+            total, rows = result
+            pager.set_total(total)
+            lazy.set_rows(rows)
+            lazy.render_initial()
 
         def pay_pending():
             sel = tree.selection()
@@ -953,20 +1588,9 @@ class HotelApp(tk.Tk):
                 return
             
             # Calculate amount
-            conn = get_db()
-            c = conn.cursor()
-            c.execute("""
-                SELECT b.check_in, b.check_out, r.price_per_night 
-                FROM Bookings b 
-                JOIN Rooms r ON b.room_id = r.room_id 
-                WHERE b.booking_id = ?
-            """, (bid,))
-            rr = c.fetchone()
-            conn.close()
+            rr = q_one(_SQL_BOOKING_TOTAL, (bid,))
             
-            start = datetime.strptime(rr["check_in"], "%Y-%m-%d").date()
-            end = datetime.strptime(rr["check_out"], "%Y-%m-%d").date()
-            total = (end - start).days * rr["price_per_night"]
+            total = rr["total"]
             
             self.show_payment(bid, total)
 
@@ -989,15 +1613,18 @@ class HotelApp(tk.Tk):
                 "Note: Refunds are processed within 5-7 business days.")
             
             if confirm:
-                conn = get_db()
-                c = conn.cursor()
-                c.execute("UPDATE Bookings SET status = 'Cancelled' WHERE booking_id = ?", (bid,))
-                conn.commit()
-                conn.close()
+                # Scoped to the logged-in customer so a stale row can't cancel someone else's booking
+                cancelled = q_exec("UPDATE Bookings SET status = 'Cancelled' WHERE booking_id = ? AND customer_id = ?",
+                                   (bid, self.user["customer_id"])).rowcount
+                if not cancelled:
+                    messagebox.showerror("Error", "Booking not found")
+                    return
+                invalidate_booking_index()
+                invalidate_stats()
                 messagebox.showinfo("Cancelled", "Booking cancelled successfully")
-                load()
+                lazy.set_cell(sel[0], "status", "Cancelled")
 
-        btn_frame = tk.Frame(self.main_frame, bg=self.colors['light'])
+        btn_frame = tk.Frame(frame, bg=self.colors['light'])
         btn_frame.pack(pady=10)
         
         ttk.Button(btn_frame, text="💳 Pay Selected", command=pay_pending,
@@ -1006,45 +1633,64 @@ class HotelApp(tk.Tk):
                   style='Danger.TButton').pack(side='left', padx=5)
         ttk.Button(btn_frame, text="Back", command=self.show_user_dashboard).pack(side='left', padx=5)
         
-        load()
+        def on_show():
+            # The screen is reused across logins; don't leave the previous
+            # customer's rows up while the new query runs
+            lazy.set_rows([])
+            pager.page = 0
+            load()
+        
+        return on_show
 
     # -----------
     # Admin Dashboard
     # -----------
     def show_admin_dashboard(self):
-        self.clear()
-        self.create_header("Admin Dashboard", "Hotel Management System")
+        self._show("admin_dashboard", self._build_admin_dashboard)
+
+    def _build_admin_dashboard(self, frame):
+        self.create_header(frame, "Admin Dashboard", "Hotel Management System")
         
         # Statistics cards
-        stats = get_dashboard_stats()
-        
-        stats_frame = tk.Frame(self.main_frame, bg=self.colors['light'])
+        stats_frame = tk.Frame(frame, bg=self.colors['light'])
         stats_frame.pack(fill='x', padx=20, pady=20)
         
         stat_cards = [
-            ("Total Rooms", stats['total_rooms'], self.colors['secondary']),
-            ("Available", stats['available_rooms'], self.colors['success']),
-            ("Total Bookings", stats['total_bookings'], self.colors['warning']),
-            ("Confirmed", stats['confirmed_bookings'], self.colors['success']),
-            ("Pending", stats['pending_bookings'], self.colors['danger']),
-            ("Revenue", f"₹{stats['total_revenue']:.0f}", self.colors['primary'])
+            ("Total Rooms", 'total_rooms', self.colors['secondary']),
+            ("Available", 'available_rooms', self.colors['success']),
+            ("Total Bookings", 'total_bookings', self.colors['warning']),
+            ("Confirmed", 'confirmed_bookings', self.colors['success']),
+            ("Pending", 'pending_bookings', self.colors['danger']),
+            ("Revenue", 'total_revenue', self.colors['primary'])
         ]
         
-        for i, (label, value, color) in enumerate(stat_cards):
+        # Cards are built once; refresh_stats only swaps the value text
+        self._stat_value_labels = []
+        for i, (label, _, color) in enumerate(stat_cards):
             card = tk.Frame(stats_frame, bg=color, relief='raised', borderwidth=2)
             card.grid(row=i//3, column=i%3, padx=10, pady=10, sticky='nsew')
             
-            tk.Label(card, text=str(value), 
-                    font=("Arial", 24, "bold"),
-                    bg=color, fg='white').pack(pady=(15, 5))
+            value_label = tk.Label(card, text="", 
+                                   font=("Arial", 24, "bold"),
+                                   bg=color, fg='white')
+            value_label.pack(pady=(15, 5))
             tk.Label(card, text=label, 
                     font=("Arial", 10),
                     bg=color, fg='white').pack(pady=(0, 15))
+            self._stat_value_labels.append(value_label)
+        
+        for col in range(3):
+            stats_frame.grid_columnconfigure(col, weight=1)
+        
+        def refresh_stats():
+            stats = get_dashboard_stats()
+            stats['total_revenue'] = f"₹{stats['total_revenue']:.0f}"
             
-            stats_frame.grid_columnconfigure(i%3, weight=1)
+            for lbl, (_, key, _) in zip(self._stat_value_labels, stat_cards):
+                lbl.config(text=str(stats[key]))
         
         # Action buttons
-        actions = tk.Frame(self.main_frame, bg=self.colors['light'])
+        actions = tk.Frame(frame, bg=self.colors['light'])
         actions.pack(pady=20)
         
         ttk.Button(actions, text="🏨 Manage Rooms", 
@@ -1062,15 +1708,19 @@ class HotelApp(tk.Tk):
         ttk.Button(actions, text="🚪 Logout", 
                   command=self.do_logout,
                   width=20).pack(side='left', padx=10)
+        
+        return refresh_stats
 
     # -----------
     # Manage Rooms
     # -----------
     def show_manage_rooms(self):
-        self.clear()
-        self.create_header("Manage Rooms", "Add, edit, or remove rooms")
+        self._show("manage_rooms", self._build_manage_rooms)
+
+    def _build_manage_rooms(self, frame):
+        self.create_header(frame, "Manage Rooms", "Add, edit, or remove rooms")
         
-        list_frame = tk.Frame(self.main_frame, bg='white')
+        list_frame = tk.Frame(frame, bg='white')
         list_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
         columns = ("id", "num", "type", "price", "status", "desc")
@@ -1095,24 +1745,33 @@ class HotelApp(tk.Tk):
         
         tree.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
+        
+        pager = Pager(frame, lambda: load_rooms(), self.colors['light'])
+        _fmt = "₹{:.2f}".format
+        lazy = LazyTree(tree, scrollbar, lambda r: (
+            r["room_id"], 
+            r["room_number"], 
+            r["room_type"], 
+            _fmt(r["price_per_night"]), 
+            r["status"], 
+            r["description"]
+        ))
 
         def load_rooms():
-            for i in tree.get_children():
-                tree.delete(i)
-            
-            conn = get_db()
-            c = conn.cursor()
-            c.execute("SELECT * FROM Rooms ORDER BY room_number")
-            for r in c.fetchall():
-                tree.insert("", "end", iid=str(r["room_id"]), values=(
-                    r["room_id"], 
-                    r["room_number"], 
-                    r["room_type"], 
-                    f"₹{r['price_per_night']:.2f}", 
-                    r["status"], 
-                    r["description"]
-                ))
-            conn.close()
+            page = pager.page
+            
+            def fetch():
+                total = q_one(_SQL_COUNT_ROOMS)["cnt"]
+                return total, q_map(lazy.values, _SQL_ROOMS_PAGE,
+                                    (PAGE_SIZE, Pager.offset_for(page, total)))
+            
+            self._async_call(fetch, populate, key="manage_rooms")
+
+        def populate(result):
+            total, rows = result
+            pager.set_total(total)
+            lazy.set_rows(rows)
+            lazy.render_initial()
 
         def add_room():
             add_win = tk.Toplevel(self)
@@ -1166,21 +1825,20 @@ class HotelApp(tk.Tk):
                     messagebox.showerror("Error", "Invalid price")
                     return
                 
-                conn = get_db()
-                c = conn.cursor()
                 try:
-                    c.execute("""
+                    q_exec("""
                         INSERT INTO Rooms (room_number, room_type, price_per_night, description) 
                         VALUES (?,?,?,?)
                     """, (num, rtype, price, desc))
-                    conn.commit()
-                    messagebox.showinfo("Success", "Room added successfully")
-                    add_win.destroy()
-                    load_rooms()
                 except sqlite3.IntegrityError:
                     messagebox.showerror("Error", "Room number already exists")
-                finally:
-                    conn.close()
+                    return
+                invalidate_stats()
+                messagebox.showinfo("Success", "Room added successfully")
+                add_win.destroy()
+                # Reload so the room lands in room_number order and the pager
+                # count is right; set_rows only touches the rows that changed
+                load_rooms()
             
             btn_frame = tk.Frame(form, bg='white')
             btn_frame.pack(pady=10)
@@ -1197,11 +1855,7 @@ class HotelApp(tk.Tk):
                 return
             
             rid = int(sel[0])
-            conn = get_db()
-            c = conn.cursor()
-            c.execute("SELECT * FROM Rooms WHERE room_id = ?", (rid,))
-            r = c.fetchone()
-            conn.close()
+            r = q_one("SELECT * FROM Rooms WHERE room_id = ?", (rid,))
             
             edit_win = tk.Toplevel(self)
             edit_win.title("Edit Room")
@@ -1266,22 +1920,22 @@ class HotelApp(tk.Tk):
                     messagebox.showerror("Error", "Invalid price")
                     return
                 
-                conn = get_db()
-                c = conn.cursor()
                 try:
-                    c.execute("""
+                    q_exec("""
                         UPDATE Rooms 
                         SET room_number=?, room_type=?, price_per_night=?, status=?, description=? 
                         WHERE room_id=?
                     """, (num, rtype, price, status, desc, rid))
-                    conn.commit()
-                    messagebox.showinfo("Success", "Room updated successfully")
-                    edit_win.destroy()
-                    load_rooms()
                 except sqlite3.IntegrityError:
                     messagebox.showerror("Error", "Room number conflict")
-                finally:
-                    conn.close()
+                    return
+                invalidate_stats()
+                messagebox.showinfo("Success", "Room updated successfully")
+                edit_win.destroy()
+                lazy.update_row(str(rid), lazy.values({
+                    "room_id": rid, "room_number": num, "room_type": rtype,
+                    "price_per_night": price, "status": status, "description": desc
+                }))
             
             btn_frame = tk.Frame(form, bg='white')
             btn_frame.pack(pady=10)
@@ -1306,26 +1960,30 @@ class HotelApp(tk.Tk):
             if not confirm:
                 return
             
-            conn = get_db()
-            c = conn.cursor()
+            # Only deletes a room with no bookings; the check and delete are one statement
+            deleted = q_exec("""
+                DELETE FROM Rooms WHERE room_id = ?
+                AND NOT EXISTS (SELECT 1 FROM Bookings WHERE room_id = ?)
+            """, (rid, rid)).rowcount
             
-            # Check if room has any bookings
-            c.execute("SELECT COUNT(*) as cnt FROM Bookings WHERE room_id = ?", (rid,))
-            if c.fetchone()['cnt'] > 0:
+            if not deleted:
+                if q_one("SELECT 1 FROM Rooms WHERE room_id = ?", (rid,)) is None:
+                    # Already gone (e.g. deleted elsewhere); the row was stale
+                    messagebox.showerror("Error", "Room not found. The list has been refreshed.")
+                    load_rooms()
+                    return
                 messagebox.showerror("Error", 
                     "Cannot delete room with existing bookings.\n"
                     "Please cancel all bookings first.")
-                conn.close()
                 return
-            
-            c.execute("DELETE FROM Rooms WHERE room_id = ?", (rid,))
-            conn.commit()
-            conn.close()
+            invalidate_stats()
             
             messagebox.showinfo("Success", "Room deleted successfully")
+            # Reload for the same reason as add_room: the page refills from the
+            # next one and the pager count drops
             load_rooms()
 
-        btn_frame = tk.Frame(self.main_frame, bg=self.colors['light'])
+        btn_frame = tk.Frame(frame, bg=self.colors['light'])
         btn_frame.pack(pady=10)
         
         ttk.Button(btn_frame, text="➕ Add Room", command=add_room,
@@ -1336,16 +1994,22 @@ class HotelApp(tk.Tk):
                   style='Danger.TButton').pack(side='left', padx=5)
         ttk.Button(btn_frame, text="Back", command=self.show_admin_dashboard).pack(side='left', padx=5)
         
-        load_rooms()
+        def on_show():
+            pager.page = 0
+            load_rooms()
+        
+        return on_show
 
     # -----------
     # View Bookings
     # -----------
     def show_view_bookings(self):
-        self.clear()
-        self.create_header("All Bookings", "View and manage all reservations")
+        self._show("view_bookings", self._build_view_bookings)
+
+    def _build_view_bookings(self, frame):
+        self.create_header(frame, "All Bookings", "View and manage all reservations")
         
-        list_frame = tk.Frame(self.main_frame, bg='white')
+        list_frame = tk.Frame(frame, bg='white')
         list_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
         columns = ("id", "customer", "room", "in", "out", "status")
@@ -1370,31 +2034,33 @@ class HotelApp(tk.Tk):
         
         tree.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
+        
+        pager = Pager(frame, lambda: load(), self.colors['light'])
+        _fd = format_date
+        lazy = LazyTree(tree, scrollbar, lambda r: (
+            r["booking_id"], 
+            r["customer"], 
+            r["room"], 
+            _fd(r["check_in"]), 
+            _fd(r["check_out"]), 
+            r["status"]
+        ))
 
         def load():
-            for i in tree.get_children():
-                tree.delete(i)
+            page = pager.page
             
-            conn = get_db()
-            c = conn.cursor()
-            c.execute("""
-                SELECT b.booking_id, cust.name as customer, r.room_number as room, 
-                       b.check_in, b.check_out, b.status
-                FROM Bookings b
-                LEFT JOIN Customers cust ON b.customer_id = cust.customer_id
-                LEFT JOIN Rooms r ON b.room_id = r.room_id
-                ORDER BY b.created_at DESC
-            """)
-            for r in c.fetchall():
-                tree.insert("", "end", values=(
-                    r["booking_id"], 
-                    r["customer"], 
-                    r["room"], 
-                    format_date(r["check_in"]), 
-                    format_date(r["check_out"]), 
-                    r["status"]
-                ))
-            conn.close()
+            def fetch():
+                total = q_one(_SQL_COUNT_BOOKINGS)["cnt"]
+                return total, q_map(lazy.values, _SQL_ALL_BOOKINGS,
+                                    (PAGE_SIZE, Pager.offset_for(page, total)))
+            
+            self._async_call(fetch, populate, key="view_bookings")
+
+        def populate(result):
+            total, rows = result
+            pager.set_total(total)
+            lazy.set_rows(rows)
+            lazy.render_initial()
 
         def set_status():
             sel = tree.selection()
@@ -1402,7 +2068,8 @@ class HotelApp(tk.Tk):
                 messagebox.showerror("Error", "Please select a booking")
                 return
             
-            bid = tree.item(sel[0])["values"][0]
+            # The table allows extended selection, so update every selected booking
+            bids = [tree.item(i)["values"][0] for i in sel]
             
             status_win = tk.Toplevel(self)
             status_win.title("Update Status")
@@ -1411,55 +2078,60 @@ class HotelApp(tk.Tk):
             status_win.transient(self)
             status_win.grab_set()
             
-            tk.Label(status_win, text="Select New Status", 
+            tk.Label(status_win, text="Select New Status" if len(bids) == 1
+                                     else f"Select New Status ({len(bids)} bookings)", 
                     font=("Arial", 12, "bold"),
                     bg='white').pack(pady=20)
             
-            status_var = tk.StringVar()
-            
-            statuses = ["Pending", "Confirmed", "Completed", "Cancelled"]
-            for s in statuses:
-                tk.Radiobutton(status_win, text=s, variable=status_var, value=s,
-                              font=("Arial", 10), bg='white').pack(anchor='w', padx=40, pady=5)
+            status_combo = ttk.Combobox(status_win, 
+                                        values=["Pending", "Confirmed", "Completed", "Cancelled"],
+                                        state='readonly', width=20)
+            status_combo.pack(pady=5)
             
             def update():
-                new_status = status_var.get()
+                new_status = status_combo.get()
                 if not new_status:
                     messagebox.showerror("Error", "Please select a status")
                     return
                 
-                conn = get_db()
-                c = conn.cursor()
-                c.execute("UPDATE Bookings SET status = ? WHERE booking_id = ?", (new_status, bid))
-                conn.commit()
-                conn.close()
+                q_exec_many("UPDATE Bookings SET status = ? WHERE booking_id = ?",
+                            [(new_status, bid) for bid in bids])
+                invalidate_booking_index()
+                invalidate_stats()
                 
                 messagebox.showinfo("Success", "Status updated successfully")
                 status_win.destroy()
-                load()
+                for iid in sel:
+                    lazy.set_cell(iid, "status", new_status)
             
             ttk.Button(status_win, text="Update", command=update,
                       style='Success.TButton', width=15).pack(pady=10)
 
-        btn_frame = tk.Frame(self.main_frame, bg=self.colors['light'])
+        btn_frame = tk.Frame(frame, bg=self.colors['light'])
         btn_frame.pack(pady=10)
         
         ttk.Button(btn_frame, text="📝 Set Status", command=set_status,
                   style='Primary.TButton').pack(side='left', padx=5)
-        ttk.Button(btn_frame, text="🔄 Refresh", command=load,
+        ttk.Button(btn_frame, text="🔄 Refresh", command=lambda: self._schedule_load(load),
                   style='Primary.TButton').pack(side='left', padx=5)
         ttk.Button(btn_frame, text="Back", command=self.show_admin_dashboard).pack(side='left', padx=5)
         
-        load()
+        def on_show():
+            pager.page = 0
+            load()
+        
+        return on_show
 
     # -----------
     # View Payments
     # -----------
     def show_view_payments(self):
-        self.clear()
-        self.create_header("Payment History", "View all payment transactions")
+        self._show("view_payments", self._build_view_payments)
+
+    def _build_view_payments(self, frame):
+        self.create_header(frame, "Payment History", "View all payment transactions")
         
-        list_frame = tk.Frame(self.main_frame, bg='white')
+        list_frame = tk.Frame(frame, bg='white')
         list_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
         columns = ("id", "booking", "customer", "amount", "date", "mode")
@@ -1484,73 +2156,74 @@ class HotelApp(tk.Tk):
         
         tree.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
+        
+        pager = Pager(frame, lambda: load(), self.colors['light'])
+        _fmt = "₹{:.2f}".format
+        lazy = LazyTree(tree, scrollbar, lambda r: (
+            r["payment_id"], 
+            r["booking_id"], 
+            r["customer"] or "N/A",
+            _fmt(r["amount"]), 
+            r["payment_date"], 
+            r["payment_mode"]
+        ))
+
+        # Total revenue display and buttons are built once; load() only
+        # updates the label text
+        total_frame = tk.Frame(frame, bg=self.colors['success'], pady=10)
+        total_frame.pack(fill='x', padx=20, pady=(0, 10))
+        
+        self._total_label = tk.Label(total_frame, text="Total Revenue: ₹0.00",
+                                     font=("Arial", 14, "bold"),
+                                     bg=self.colors['success'],
+                                     fg='white')
+        self._total_label.pack()
+
+        btn_frame = tk.Frame(frame, bg=self.colors['light'])
+        btn_frame.pack(pady=10)
 
         def load():
-            for i in tree.get_children():
-                tree.delete(i)
-            
-            conn = get_db()
-            c = conn.cursor()
-            c.execute("""
-                SELECT p.payment_id, p.booking_id, c.name as customer, 
-                       p.amount, p.payment_date, p.payment_mode
-                FROM Payments p
-                LEFT JOIN Bookings b ON p.booking_id = b.booking_id
-                LEFT JOIN Customers c ON b.customer_id = c.customer_id
-                ORDER BY p.payment_date DESC
-            """)
-            
-            total_revenue = 0
-            for r in c.fetchall():
-                tree.insert("", "end", values=(
-                    r["payment_id"], 
-                    r["booking_id"], 
-                    r["customer"] or "N/A",
-                    f"₹{r['amount']:.2f}", 
-                    r["payment_date"], 
-                    r["payment_mode"]
-                ))
-                total_revenue += r["amount"]
+            page = pager.page
             
-            conn.close()
+            def fetch():
+                totals = q_one(_SQL_PAYMENT_TOTALS)
+                return totals, q_map(lazy.values, _SQL_PAYMENTS,
+                                     (PAGE_SIZE, Pager.offset_for(page, totals["cnt"])))
             
-            # Show total revenue
-            total_label.config(text=f"Total Revenue: ₹{total_revenue:.2f}")
-
-        # Total revenue display
-        total_frame = tk.Frame(self.main_frame, bg=self.colors['success'], pady=10)
-        total_frame.pack(fill='x', padx=20, pady=(0, 10))
-        
-        total_label = tk.Label(total_frame, text="Total Revenue: ₹0.00",
-                              font=("Arial", 14, "bold"),
-                              bg=self.colors['success'],
-                              fg='white')
-        total_label.pack()
+            self._async_call(fetch, populate, key="view_payments")
 
-        btn_frame = tk.Frame(self.main_frame, bg=self.colors['light'])
-        btn_frame.pack(pady=10)
+        def populate(result):
+            totals, rows = result
+            pager.set_total(totals["cnt"])
+            lazy.set_rows(rows)
+            lazy.render_initial()
+            
+            # Show total revenue across all pages
+            self._total_label.configure(text=f"Total Revenue: ₹{totals['revenue']:,.2f}")
         
-        ttk.Button(btn_frame, text="🔄 Refresh", command=load,
+        ttk.Button(btn_frame, text="🔄 Refresh", command=lambda: self._schedule_load(load),
                   style='Primary.TButton').pack(side='left', padx=5)
         ttk.Button(btn_frame, text="Back", command=self.show_admin_dashboard).pack(side='left', padx=5)
         
-        load()
+        def on_show():
+            pager.page = 0
+            load()
+        
+        return on_show
 
 
 # ---------------------------
 # Entry point
 # ---------------------------
 if __name__ == "__main__":
-    try:
-        # Check if tkcalendar is installed
-        import tkcalendar
-    except ImportError:
+    # Check if tkcalendar is installed without importing it; the date
+    # pickers import it when their screen is first built
+    import importlib.util
+    if importlib.util.find_spec("tkcalendar") is None:
         print("Error: tkcalendar module not found!")
         print("Please install it using: pip install tkcalendar")
         import sys
         sys.exit(1)
     
-    create_tables()
-    seed_data()
     app = HotelApp()
     app.mainloop()